@@ -7,26 +7,65 @@ Combines setup and implementation in one command
 import os
 import sys
 import asyncio
+import functools
 import subprocess
 from pathlib import Path
 
+REQUIRED_TOOLS = ("python", "node", "npm", "git")
+
+# (icon, name, description) rows shown by show_feature_overview
+_FEATURES = (
+    ("🔁", "Prompt Memory + Context Awareness", "Track and reuse previous prompts"),
+    ("🧩", "Component Library Detection", "Auto-detect and map UI components"),
+    ("🌐", "Multi-Deployment Options", "Deploy to Render, Vercel, Netlify, Docker"),
+    ("🤖", "LLM-based UI Validator", "Code quality analysis with DeepSeek"),
+    ("🧪", "Test Coverage Generator", "Auto-generate Jest test cases"),
+    ("📦", "Export Modes", "Export as App, Component, or JSON Schema"),
+    ("🎨", "Live Figma Feedback Loop", "Real-time design-to-code sync"),
+)
+
+@functools.lru_cache(maxsize=None)
+def _path_entries():
+    """Map each file name in PATH directories to the directories holding it, scanned once per process"""
+    entries = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        directory = directory or "."
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name.lower() if os.name == "nt" else entry.name
+                    entries.setdefault(name, []).append(directory)
+        except OSError:
+            continue
+    return entries
+
+def _is_executable(path):
+    """True for a runnable file, excluding directories, dangling links and non-executables"""
+    return os.access(path, os.X_OK) and not os.path.isdir(path)
+
+def find_tool(tool):
+    """Check whether an executable is on PATH without launching it"""
+    entries = _path_entries()
+    names = [tool]
+    if os.name == "nt":
+        extensions = os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").lower().split(";")
+        names = [f"{tool}{ext}" for ext in ["", *extensions]]
+    # Directories are in PATH order; a name match still has to be a runnable file
+    return any(
+        _is_executable(os.path.join(directory, name))
+        for name in names
+        for directory in entries.get(name, ())
+    )
+
 def check_requirements():
     """Check if required tools are installed"""
     print("🔍 Checking requirements...")
     
-    requirements = {
-        "python": "python --version",
-        "node": "node --version",
-        "npm": "npm --version",
-        "git": "git --version"
-    }
-    
     missing = []
-    for tool, command in requirements.items():
-        try:
-            subprocess.run(command.split(), capture_output=True, check=True)
+    for tool in REQUIRED_TOOLS:
+        if find_tool(tool):
             print(f"  ✅ {tool}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             print(f"  ❌ {tool}")
             missing.append(tool)
     
@@ -92,41 +131,44 @@ async def run_implementation():
         print(f"❌ Implementation failed: {e}")
         return False
 
-def start_development_servers():
+async def start_development_servers():
     """Start the development servers"""
     print("\n🚀 Starting development servers...")
     
-    # Check if Docker is available
+    # Try Docker Compose directly; a missing docker binary is the only signal we need
     try:
-        subprocess.run(["docker", "--version"], capture_output=True, check=True)
-        print("🐳 Docker detected. Starting with Docker Compose...")
-        
-        try:
-            subprocess.run([
-                "docker-compose", 
-                "-f", "docker-compose.advanced.yml", 
-                "up", "-d"
-            ], check=True)
-            print("✅ Services started with Docker!")
-            print("🌐 Frontend: http://localhost:3000")
-            print("🔧 Backend: http://localhost:8000")
-            print("📚 API Docs: http://localhost:8000/docs")
-            return True
-        except subprocess.CalledProcessError:
-            print("❌ Docker Compose failed. Trying manual start...")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        result = subprocess.run([
+            "docker", "compose",
+            "-f", "docker-compose.advanced.yml",
+            "up", "-d"
+        ], check=False)
+        returncode = result.returncode
+    except FileNotFoundError:
+        returncode = 127
+    
+    if returncode == 0:
+        print("🐳 Docker detected. Services started with Docker Compose!")
+        print("🌐 Frontend: http://localhost:3000")
+        print("🔧 Backend: http://localhost:8000")
+        print("📚 API Docs: http://localhost:8000/docs")
+        return True
+    elif returncode == 127:
         print("🔧 Docker not available. Starting manually...")
+    else:
+        print("❌ Docker Compose failed. Trying manual start...")
     
     # Manual start
     print("Starting backend...")
-    backend_process = subprocess.Popen([
-        sys.executable, "-m", "uvicorn", "main:app", "--reload", "--port", "8000"
-    ], cwd="backend")
+    backend_process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "uvicorn", "main:app", "--reload", "--port", "8000",
+        cwd="backend"
+    )
     
     print("Starting frontend...")
-    frontend_process = subprocess.Popen([
-        "npm", "run", "dev"
-    ], cwd="frontend")
+    frontend_process = await asyncio.create_subprocess_exec(
+        "npm", "run", "dev",
+        cwd="frontend"
+    )
     
     print("✅ Services started manually!")
     print("🌐 Frontend: http://localhost:3000")
@@ -134,13 +176,19 @@ def start_development_servers():
     print("📚 API Docs: http://localhost:8000/docs")
     print("\n⚠️  Press Ctrl+C to stop all services")
     
+    processes = [backend_process, frontend_process]
+    waiters = [asyncio.create_task(process.wait()) for process in processes]
     try:
-        backend_process.wait()
-        frontend_process.wait()
-    except KeyboardInterrupt:
+        # Return as soon as either service exits so the other is not left orphaned
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        print("\n⚠️  A service exited. Stopping remaining services...")
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n🛑 Stopping services...")
-        backend_process.terminate()
-        frontend_process.terminate()
+    finally:
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*waiters, return_exceptions=True)
     
     return True
 
@@ -150,17 +198,7 @@ def show_feature_overview():
     print("🎉 ADVANCED AI-POWERED UI BUILDER FEATURES")
     print("="*60)
     
-    features = [
-        ("🔁", "Prompt Memory + Context Awareness", "Track and reuse previous prompts"),
-        ("🧩", "Component Library Detection", "Auto-detect and map UI components"),
-        ("🌐", "Multi-Deployment Options", "Deploy to Render, Vercel, Netlify, Docker"),
-        ("🤖", "LLM-based UI Validator", "Code quality analysis with DeepSeek"),
-        ("🧪", "Test Coverage Generator", "Auto-generate Jest test cases"),
-        ("📦", "Export Modes", "Export as App, Component, or JSON Schema"),
-        ("🎨", "Live Figma Feedback Loop", "Real-time design-to-code sync")
-    ]
-    
-    for icon, name, description in features:
+    for icon, name, description in _FEATURES:
         print(f"{icon} {name}")
         print(f"   {description}")
         print()
@@ -202,7 +240,10 @@ def main():
     print("\n🚀 Ready to start development servers?")
     response = input("Start servers now? (Y/n): ").lower()
     if response != 'n':
-        start_development_servers()
+        try:
+            asyncio.run(start_development_servers())
+        except KeyboardInterrupt:
+            pass
     
     # Show feature overview
     show_feature_overview()
@@ -3,10 +3,60 @@
 Simple test runner for AI UI Builder
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
+import signal
+import socket
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_PORT = 8000
+PYTHON_DEPENDENCIES = ("fastapi", "uvicorn", "sqlalchemy", "pydantic")
+NODE_VERSION_ENV = "AI_UI_BUILDER_NODE_VERSION"
+
+def wait_for_port(port, host="127.0.0.1", process=None, timeout=5.0):
+    """Poll until a TCP server accepts connections, backing off between attempts.
+    
+    Gives up after timeout seconds, or as soon as process (if given) has exited.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((host, port), timeout=delay):
+                return True
+        except OSError:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
+
+def stop_process_group(process, grace=0.5):
+    """Terminate a process and its group, escalating to a kill after grace seconds"""
+    if os.name == 'posix':
+        try:
+            pgid = os.getpgid(process.pid)
+        except ProcessLookupError:
+            return
+        os.killpg(pgid, signal.SIGTERM)
+        try:
+            process.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            os.killpg(pgid, signal.SIGKILL)
+            process.wait()
+    else:
+        process.terminate()
+        try:
+            process.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
 
 def run_backend_tests():
     """Run backend API tests"""
@@ -15,18 +65,26 @@ def run_backend_tests():
     # Change to backend directory
     backend_dir = os.path.join(os.path.dirname(__file__), 'backend')
     
+    backend_process = None
     try:
-        # Start the backend server in background
+        # Start the backend server in background, in its own process group so
+        # any workers it spawns are torn down with it
         backend_process = subprocess.Popen(
             [sys.executable, 'main.py'],
             cwd=backend_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=(os.name == 'posix'),
+            creationflags=(subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0)
         )
         
         # Wait for server to start
         print("⏳ Waiting for server to start...")
-        time.sleep(5)
+        if not wait_for_port(BACKEND_PORT, process=backend_process):
+            if backend_process.poll() is not None:
+                print(f"❌ Backend server exited during startup (code {backend_process.returncode})")
+                return False
+            print("⚠️  Server not reachable yet, running tests anyway...")
         
         # Run the comprehensive tests
         print("🧪 Running End-to-End Tests...")
@@ -44,11 +102,8 @@ def run_backend_tests():
         return False
     finally:
         # Clean up backend process
-        try:
-            backend_process.terminate()
-            backend_process.wait(timeout=5)
-        except:
-            backend_process.kill()
+        if backend_process is not None:
+            stop_process_group(backend_process)
 
 def run_frontend_tests():
     """Run frontend tests"""
@@ -59,7 +114,13 @@ def run_frontend_tests():
     # Check if node_modules exists
     if not os.path.exists(os.path.join(frontend_dir, 'node_modules')):
         print("📦 Installing frontend dependencies...")
-        subprocess.run(['npm', 'install'], cwd=frontend_dir)
+        # Logged to a file and printed in one go, so npm's live output doesn't
+        # interleave with the backend stage running alongside
+        install_log = os.path.join(frontend_dir, 'npm-install.log')
+        with open(install_log, 'wb') as log:
+            subprocess.run(['npm', 'install'], cwd=frontend_dir, stdout=log, stderr=subprocess.STDOUT)
+        with open(install_log, encoding='utf-8', errors='replace') as log:
+            print("npm install output:", log.read())
     
     # Run frontend tests (if they exist)
     try:
@@ -75,29 +136,28 @@ def check_dependencies():
     """Check if all dependencies are installed"""
     print("🔍 Checking Dependencies...")
     
-    # Check Python dependencies
-    try:
-        import fastapi
-        import uvicorn
-        import sqlalchemy
-        import pydantic
-        print("✅ Python dependencies OK")
-    except ImportError as e:
-        print(f"❌ Missing Python dependency: {e}")
+    # Check Python dependencies (resolve only, without executing the modules)
+    missing = [m for m in PYTHON_DEPENDENCIES if importlib.util.find_spec(m) is None]
+    if missing:
+        print(f"❌ Missing Python dependency: {', '.join(missing)}")
         print("💡 Run: pip install -r backend/requirements.txt")
         return False
+    print("✅ Python dependencies OK")
     
-    # Check Node.js
-    try:
-        result = subprocess.run(['node', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ Node.js OK ({result.stdout.strip()})")
-        else:
-            print("❌ Node.js not found")
+    # Check Node.js (version is cached in the environment for child runs)
+    node_version = os.environ.get(NODE_VERSION_ENV)
+    if not node_version:
+        try:
+            result = subprocess.run(['node', '--version'], capture_output=True, text=True)
+            if result.returncode != 0:
+                print("❌ Node.js not found")
+                return False
+            node_version = result.stdout.strip()
+            os.environ[NODE_VERSION_ENV] = node_version
+        except FileNotFoundError:
+            print("❌ Node.js not installed")
             return False
-    except FileNotFoundError:
-        print("❌ Node.js not installed")
-        return False
+    print(f"✅ Node.js OK ({node_version})")
     
     return True
 
@@ -111,9 +171,12 @@ def main():
         print("❌ Dependency check failed. Please install missing dependencies.")
         return 1
     
-    # Run tests
-    backend_success = run_backend_tests()
-    frontend_success = run_frontend_tests()
+    # Run tests (backend boot and npm install are independent, so overlap them)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backend_future = executor.submit(run_backend_tests)
+        frontend_future = executor.submit(run_frontend_tests)
+        backend_success = backend_future.result()
+        frontend_success = frontend_future.result()
     
     print("\n" + "=" * 50)
     print("📊 TEST SUMMARY")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+'''
+Setup script for implemented high priority features
+'''
+
+import os
+import subprocess
+import sys
+
+def install_requirements():
+    '''Install Python requirements'''
+    subprocess.check_call([
+        sys.executable, "-m", "pip", "install", 
+        "-r", "requirements_implemented.txt"
+    ])
+
+def setup_database():
+    '''Setup database tables'''
+    # Add database setup logic here
+    pass
+
+def main():
+    print("Setting up AI UI Builder high priority features...")
+    
+    # Install requirements
+    print("Installing requirements...")
+    install_requirements()
+    
+    # Setup database
+    print("Setting up database...")
+    setup_database()
+    
+    print("Setup complete!")
+    print("Next steps:")
+    print("1. Copy .env.template to .env and fill in your API keys")
+    print("2. Run the application with: python -m uvicorn main:app --reload")
+
+if __name__ == "__main__":
+    main()
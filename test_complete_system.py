@@ -6,24 +6,272 @@ Tests all major features and integrations
 
 import asyncio
 import aiohttp
+import hashlib
 import json
+import os
+import sys
 import time
 from typing import Dict, List, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Generation job polling
+STATUS_POLL_INTERVAL = 0.2
+STATUS_POLL_TIMEOUT = 10
+TERMINAL_JOB_STATUSES = ("completed", "failed", "cancelled")
+
+# Tests allowed in flight at once against the single-worker dev server
+MAX_CONCURRENT_TESTS = 4
+
+# Features summarised in the report, matched against test names
+REPORTED_FEATURES = (
+    "Prompt Memory",
+    "Component Detection",
+    "Code Validation",
+    "Test Generation",
+    "Export System",
+    "UI Generation",
+    "Integration"
+)
+
+# Opt-in cache of successful LLM-backed responses, keyed by endpoint and payload
+TEST_CACHE_ENV = "AI_UI_BUILDER_TEST_CACHE"
+TEST_CACHE_PATH = "ai-ui-builder/.test_cache.json"
+TEST_CACHE_TTL = 600  # seconds; keeps reuse within one development iteration
+
+REPORT_PATH = "ai-ui-builder/test_report.json"
+# Reports at least this large are written zstd-compressed when zstandard is installed
+REPORT_COMPRESS_THRESHOLD = 256 * 1024
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def encode_json(obj: Any) -> bytes:
+    """Encode a request body straight to bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase a prompt and collapse its whitespace, so trivially different wordings share a cache key"""
+    return " ".join(prompt.lower().split())
+
+def elapsed(start_ns: int) -> float:
+    """Seconds since a time.perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+def write_report(path: str, data: Dict[str, Any]) -> str:
+    """Write the JSON report via a temp file so an interrupted run never leaves it half-written.
+    
+    Large reports are zstd-compressed to ``<path>.zst`` when zstandard is installed.
+    Returns the path actually written.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    
+    if zstandard is not None and len(payload) >= REPORT_COMPRESS_THRESHOLD:
+        payload = zstandard.ZstdCompressor(level=3).compress(payload)
+        path += ".zst"
+    
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return path
+
+# Request payloads, encoded once at import rather than rebuilt on every test call
+HISTORY_TEST_PROMPTS = (
+    {
+        "prompt": "Create a modern dashboard with charts and navigation",
+        "user_id": "test_user_123",
+        "project_name": "Test Dashboard",
+        "category": "dashboard",
+        "tags": ["dashboard", "charts", "navigation"]
+    },
+    {
+        "prompt": "Create a landing page with a hero section and pricing table",
+        "user_id": "test_user_456",
+        "project_name": "Test Landing Page",
+        "category": "landing",
+        "tags": ["landing", "hero", "pricing"]
+    }
+)
+HISTORY_SAVE_BODIES = tuple((p["user_id"], encode_json(p)) for p in HISTORY_TEST_PROMPTS)
+
+COMPONENT_DETECTION_REQUEST = {
+    "prompt": "I need a dashboard with navigation, data cards, and interactive charts",
+    "framework": "react",
+    "user_context": {"experience_level": "intermediate"}
+}
+COMPONENT_DETECTION_BODY = encode_json(COMPONENT_DETECTION_REQUEST)
+
+VALIDATION_CODE = """
+import React from 'react';
+
+const TestComponent = ({ title, onClick }) => {
+  return (
+    <div>
+      <img src="test.jpg">
+      <button onClick={onClick} style={{color: 'red'}}>
+        {title}
+      </button>
+      <console.log('debug');
+    </div>
+  );
+};
+
+export default TestComponent;
+"""
+
+VALIDATION_BODY = encode_json({
+    "code": VALIDATION_CODE,
+    "code_type": "react"
+})
+
+COUNTER_COMPONENT = """
+import React, { useState } from 'react';
+
+const Counter = ({ initialValue = 0 }) => {
+  const [count, setCount] = useState(initialValue);
+  
+  return (
+    <div>
+      <h1>Count: {count}</h1>
+      <button onClick={() => setCount(count + 1)}>Increment</button>
+      <button onClick={() => setCount(count - 1)}>Decrement</button>
+    </div>
+  );
+};
+
+export default Counter;
+"""
+
+TEST_GENERATION_BODY = encode_json({
+    "component_code": COUNTER_COMPONENT,
+    "component_name": "Counter",
+    "framework": "react",
+    "test_types": ["unit", "integration", "accessibility"],
+    "coverage_target": 0.9
+})
+
+EXPORT_COMPONENT = """
+import React from 'react';
+
+const ExportTestComponent = () => {
+  return (
+    <div className="container">
+      <h1>Hello World</h1>
+      <p>This is a test component for export.</p>
+    </div>
+  );
+};
+
+export default ExportTestComponent;
+"""
+
+# React App export
+EXPORT_BODY = encode_json({
+    "code": EXPORT_COMPONENT,
+    "component_name": "ExportTestComponent",
+    "export_type": "react-app",
+    "options": {
+        "include_tests": True,
+        "include_storybook": True
+    }
+})
+
+# Complete UI generation flow
+GENERATION_BODY = encode_json({
+    "prompt": "Create a modern SaaS dashboard with dark theme, sidebar navigation, and interactive charts",
+    "user_id": "test_user_flow",
+    "project_name": "SaaS Dashboard Test"
+})
+
 class AIUIBuilderTester:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.session = None
         self.test_results = []
+        self.use_cache = os.environ.get(TEST_CACHE_ENV) == "1"
+        self._cache: Dict[str, Any] = {}
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # One keep-alive pool and timeout policy shared by every test request
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        if self.use_cache:
+            # A missing or corrupt cache file just means starting with an empty cache
+            try:
+                with open(TEST_CACHE_PATH) as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = {}
+            if not isinstance(cached, dict):
+                cached = {}
+            now = time.time()
+            self._cache = {
+                key: entry for key, entry in cached.items()
+                if isinstance(entry, dict) and now - entry.get("saved_at", 0) < TEST_CACHE_TTL
+            }
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+        if self.use_cache and self._cache:
+            os.makedirs(os.path.dirname(TEST_CACHE_PATH), exist_ok=True)
+            tmp_path = TEST_CACHE_PATH + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_path, TEST_CACHE_PATH)
+    
+    def post_json(self, url: str, body: bytes):
+        """POST a pre-encoded JSON body"""
+        return self.session.post(url, data=body, headers=JSON_HEADERS)
+    
+    async def cached_post(self, url: str, body: bytes, cache_text: str = None):
+        """POST a JSON body, reusing a cached 200 response when caching is enabled.
+        
+        The cache key is derived from ``cache_text`` when given, otherwise from the exact body.
+        """
+        key = None
+        if self.use_cache:
+            key_source = cache_text.encode("utf-8") if cache_text is not None else body
+            key = hashlib.blake2b(url.encode("utf-8") + b"\n" + key_source, digest_size=16).hexdigest()
+            if key in self._cache:
+                return 200, self._cache[key]["response"]
+        
+        async with self.post_json(url, body) as response:
+            if response.status != 200:
+                return response.status, None
+            data = await response.json()
+        
+        if key is not None:
+            self._cache[key] = {"saved_at": time.time(), "response": data}
+        return 200, data
     
     def log_test(self, test_name: str, success: bool, message: str = "", duration: float = 0):
         """Log test result"""
@@ -32,7 +280,8 @@ class AIUIBuilderTester:
             "success": success,
             "message": message,
             "duration": duration,
-            "timestamp": datetime.now().isoformat()
+            # Formatted to ISO only when the report is written
+            "ts_ns": time.time_ns()
         }
         self.test_results.append(result)
         status = "✅ PASS" if success else "❌ FAIL"
@@ -40,217 +289,144 @@ class AIUIBuilderTester:
     
     async def test_api_health(self):
         """Test basic API health"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
             async with self.session.get(f"{self.base_url}/") as response:
                 if response.status == 200:
                     data = await response.json()
-                    self.log_test("API Health Check", True, f"API responding: {data.get('message', 'OK')}", time.time() - start_time)
+                    self.log_test("API Health Check", True, f"API responding: {data.get('message', 'OK')}", elapsed(start_time))
                     return True
                 else:
-                    self.log_test("API Health Check", False, f"Status: {response.status}", time.time() - start_time)
+                    self.log_test("API Health Check", False, f"Status: {response.status}", elapsed(start_time))
                     return False
         except Exception as e:
-            self.log_test("API Health Check", False, f"Connection error: {str(e)}", time.time() - start_time)
+            self.log_test("API Health Check", False, f"Connection error: {str(e)}", elapsed(start_time))
             return False
     
     async def test_prompt_memory_system(self):
         """Test Prompt Memory functionality"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
-            # Test saving prompt history
-            test_prompt = {
-                "prompt": "Create a modern dashboard with charts and navigation",
-                "user_id": "test_user_123",
-                "project_name": "Test Dashboard",
-                "category": "dashboard",
-                "tags": ["dashboard", "charts", "navigation"]
-            }
+            # Test saving prompt history for a couple of independent users at once
+            async def save(body):
+                async with self.post_json(
+                    f"{self.base_url}/api/v1/history/save",
+                    body
+                ) as response:
+                    return response.status
             
-            async with self.session.post(
-                f"{self.base_url}/api/v1/history/save",
-                json=test_prompt
-            ) as response:
-                if response.status == 200:
-                    # Test retrieving history
-                    async with self.session.get(
-                        f"{self.base_url}/api/v1/history/test_user_123"
-                    ) as get_response:
-                        if get_response.status == 200:
-                            history_data = await get_response.json()
-                            self.log_test("Prompt Memory System", True, f"Saved and retrieved {len(history_data.get('history', []))} prompts", time.time() - start_time)
-                            return True
-                        else:
-                            self.log_test("Prompt Memory System", False, f"Failed to retrieve history: {get_response.status}", time.time() - start_time)
-                            return False
-                else:
-                    self.log_test("Prompt Memory System", False, f"Failed to save prompt: {response.status}", time.time() - start_time)
-                    return False
+            async def retrieve(user_id):
+                async with self.session.get(
+                    f"{self.base_url}/api/v1/history/{user_id}"
+                ) as response:
+                    if response.status != 200:
+                        return response.status, []
+                    data = await response.json()
+                    return response.status, data.get('history', [])
+            
+            save_statuses = await asyncio.gather(*(save(body) for _, body in HISTORY_SAVE_BODIES))
+            failed_save = next((s for s in save_statuses if s != 200), None)
+            if failed_save is not None:
+                self.log_test("Prompt Memory System", False, f"Failed to save prompt: {failed_save}", elapsed(start_time))
+                return False
+            
+            # Test retrieving history
+            retrieved = await asyncio.gather(*(retrieve(user_id) for user_id, _ in HISTORY_SAVE_BODIES))
+            failed_get = next((s for s, _ in retrieved if s != 200), None)
+            if failed_get is not None:
+                self.log_test("Prompt Memory System", False, f"Failed to retrieve history: {failed_get}", elapsed(start_time))
+                return False
+            
+            total = sum(len(history) for _, history in retrieved)
+            self.log_test("Prompt Memory System", True, f"Saved and retrieved {total} prompts for {len(retrieved)} users", elapsed(start_time))
+            return True
         except Exception as e:
-            self.log_test("Prompt Memory System", False, f"Error: {str(e)}", time.time() - start_time)
+            self.log_test("Prompt Memory System", False, f"Error: {str(e)}", elapsed(start_time))
             return False
     
     async def test_component_detection(self):
         """Test AI Component Detection"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
-            test_request = {
-                "prompt": "I need a dashboard with navigation, data cards, and interactive charts",
-                "framework": "react",
-                "user_context": {"experience_level": "intermediate"}
-            }
-            
-            async with self.session.post(
+            # Keyed on the normalized prompt and framework rather than the exact body
+            cache_text = "|".join((
+                normalize_prompt(COMPONENT_DETECTION_REQUEST["prompt"]),
+                COMPONENT_DETECTION_REQUEST["framework"]
+            ))
+            status_code, data = await self.cached_post(
                 f"{self.base_url}/api/v1/components/detect",
-                json=test_request
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    recommendations = data.get("recommendations", [])
-                    confidence = data.get("overall_confidence", 0)
-                    self.log_test("Component Detection", True, f"Found {len(recommendations)} components with {confidence:.1%} confidence", time.time() - start_time)
-                    return True
-                else:
-                    self.log_test("Component Detection", False, f"Status: {response.status}", time.time() - start_time)
-                    return False
+                COMPONENT_DETECTION_BODY,
+                cache_text
+            )
+            if status_code == 200:
+                recommendations = data.get("recommendations", [])
+                confidence = data.get("overall_confidence", 0)
+                self.log_test("Component Detection", True, f"Found {len(recommendations)} components with {confidence:.1%} confidence", elapsed(start_time))
+                return True
+            else:
+                self.log_test("Component Detection", False, f"Status: {status_code}", elapsed(start_time))
+                return False
         except Exception as e:
-            self.log_test("Component Detection", False, f"Error: {str(e)}", time.time() - start_time)
+            self.log_test("Component Detection", False, f"Error: {str(e)}", elapsed(start_time))
             return False
     
     async def test_code_validation(self):
         """Test LLM-based Code Validation"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
-            test_code = """
-import React from 'react';
-
-const TestComponent = ({ title, onClick }) => {
-  return (
-    <div>
-      <img src="test.jpg">
-      <button onClick={onClick} style={{color: 'red'}}>
-        {title}
-      </button>
-      <console.log('debug');
-    </div>
-  );
-};
-
-export default TestComponent;
-"""
-            
-            test_request = {
-                "code": test_code,
-                "code_type": "react"
-            }
-            
-            async with self.session.post(
+            status_code, data = await self.cached_post(
                 f"{self.base_url}/api/v1/validation/validate",
-                json=test_request
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    score = data.get("score", 0)
-                    issues = data.get("issues", [])
-                    accessibility_score = data.get("accessibility_score", 0)
-                    performance_score = data.get("performance_score", 0)
-                    code_quality_score = data.get("code_quality_score", 0)
-                    
-                    self.log_test("Code Validation", True, 
-                        f"Score: {score}/10, Issues: {len(issues)}, A11y: {accessibility_score}, Perf: {performance_score}, Quality: {code_quality_score}", 
-                        time.time() - start_time)
-                    return True
-                else:
-                    self.log_test("Code Validation", False, f"Status: {response.status}", time.time() - start_time)
-                    return False
+                VALIDATION_BODY
+            )
+            if status_code == 200:
+                score = data.get("score", 0)
+                issues = data.get("issues", [])
+                accessibility_score = data.get("accessibility_score", 0)
+                performance_score = data.get("performance_score", 0)
+                code_quality_score = data.get("code_quality_score", 0)
+                
+                self.log_test("Code Validation", True, 
+                    f"Score: {score}/10, Issues: {len(issues)}, A11y: {accessibility_score}, Perf: {performance_score}, Quality: {code_quality_score}", 
+                    elapsed(start_time))
+                return True
+            else:
+                self.log_test("Code Validation", False, f"Status: {status_code}", elapsed(start_time))
+                return False
         except Exception as e:
-            self.log_test("Code Validation", False, f"Error: {str(e)}", time.time() - start_time)
+            self.log_test("Code Validation", False, f"Error: {str(e)}", elapsed(start_time))
             return False
     
     async def test_test_generation(self):
         """Test AI Test Generation"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
-            test_component = """
-import React, { useState } from 'react';
-
-const Counter = ({ initialValue = 0 }) => {
-  const [count, setCount] = useState(initialValue);
-  
-  return (
-    <div>
-      <h1>Count: {count}</h1>
-      <button onClick={() => setCount(count + 1)}>Increment</button>
-      <button onClick={() => setCount(count - 1)}>Decrement</button>
-    </div>
-  );
-};
-
-export default Counter;
-"""
-            
-            test_request = {
-                "component_code": test_component,
-                "component_name": "Counter",
-                "framework": "react",
-                "test_types": ["unit", "integration", "accessibility"],
-                "coverage_target": 0.9
-            }
-            
-            async with self.session.post(
+            status_code, data = await self.cached_post(
                 f"{self.base_url}/api/v1/testing/generate",
-                json=test_request
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    test_files = data.get("test_files", [])
-                    coverage_estimate = data.get("coverage_estimate", 0)
-                    test_count = data.get("test_count", 0)
-                    
-                    self.log_test("Test Generation", True, 
-                        f"Generated {len(test_files)} test files, {test_count} tests, {coverage_estimate:.1%} coverage", 
-                        time.time() - start_time)
-                    return True
-                else:
-                    self.log_test("Test Generation", False, f"Status: {response.status}", time.time() - start_time)
-                    return False
+                TEST_GENERATION_BODY
+            )
+            if status_code == 200:
+                test_files = data.get("test_files", [])
+                coverage_estimate = data.get("coverage_estimate", 0)
+                test_count = data.get("test_count", 0)
+                
+                self.log_test("Test Generation", True, 
+                    f"Generated {len(test_files)} test files, {test_count} tests, {coverage_estimate:.1%} coverage", 
+                    elapsed(start_time))
+                return True
+            else:
+                self.log_test("Test Generation", False, f"Status: {status_code}", elapsed(start_time))
+                return False
         except Exception as e:
-            self.log_test("Test Generation", False, f"Error: {str(e)}", time.time() - start_time)
+            self.log_test("Test Generation", False, f"Error: {str(e)}", elapsed(start_time))
             return False
     
     async def test_export_system(self):
         """Test Export System"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
-            test_code = """
-import React from 'react';
-
-const ExportTestComponent = () => {
-  return (
-    <div className="container">
-      <h1>Hello World</h1>
-      <p>This is a test component for export.</p>
-    </div>
-  );
-};
-
-export default ExportTestComponent;
-"""
-            
-            # Test React App export
-            export_request = {
-                "code": test_code,
-                "component_name": "ExportTestComponent",
-                "export_type": "react-app",
-                "options": {
-                    "include_tests": True,
-                    "include_storybook": True
-                }
-            }
-            
-            async with self.session.post(
+            async with self.post_json(
                 f"{self.base_url}/api/v1/export/generate",
-                json=export_request
+                EXPORT_BODY
             ) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -258,70 +434,67 @@ export default ExportTestComponent;
                     files = data.get("files", {})
                     
                     if success:
-                        self.log_test("Export System", True, f"Generated {len(files)} files for React app export", time.time() - start_time)
+                        self.log_test("Export System", True, f"Generated {len(files)} files for React app export", elapsed(start_time))
                         return True
                     else:
-                        self.log_test("Export System", False, "Export marked as unsuccessful", time.time() - start_time)
+                        self.log_test("Export System", False, "Export marked as unsuccessful", elapsed(start_time))
                         return False
                 else:
-                    self.log_test("Export System", False, f"Status: {response.status}", time.time() - start_time)
+                    self.log_test("Export System", False, f"Status: {response.status}", elapsed(start_time))
                     return False
         except Exception as e:
-            self.log_test("Export System", False, f"Error: {str(e)}", time.time() - start_time)
+            self.log_test("Export System", False, f"Error: {str(e)}", elapsed(start_time))
             return False
     
     async def test_ui_generation_flow(self):
         """Test complete UI generation flow"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
-            # Simulate the complete flow
-            generation_request = {
-                "prompt": "Create a modern SaaS dashboard with dark theme, sidebar navigation, and interactive charts",
-                "user_id": "test_user_flow",
-                "project_name": "SaaS Dashboard Test"
-            }
-            
-            async with self.session.post(
+            async with self.post_json(
                 f"{self.base_url}/generate",
-                json=generation_request
+                GENERATION_BODY
             ) as response:
                 if response.status == 200:
                     data = await response.json()
                     job_id = data.get("job_id")
                     
                     if job_id:
-                        # Poll for completion (simplified)
-                        await asyncio.sleep(2)  # Wait for processing
-                        
-                        async with self.session.get(
-                            f"{self.base_url}/status/{job_id}"
-                        ) as status_response:
-                            if status_response.status == 200:
+                        # Poll until the job settles, bounded so a stuck job can't hang the suite
+                        status_data = None
+                        deadline = time.monotonic() + STATUS_POLL_TIMEOUT
+                        while True:
+                            async with self.session.get(
+                                f"{self.base_url}/status/{job_id}"
+                            ) as status_response:
+                                if status_response.status != 200:
+                                    self.log_test("UI Generation Flow", False, f"Status check failed: {status_response.status}", elapsed(start_time))
+                                    return False
                                 status_data = await status_response.json()
-                                status = status_data.get("status", "unknown")
-                                current_step = status_data.get("current_step", 0)
-                                total_steps = status_data.get("total_steps", 5)
-                                
-                                self.log_test("UI Generation Flow", True, 
-                                    f"Job {job_id} status: {status}, Step: {current_step}/{total_steps}", 
-                                    time.time() - start_time)
-                                return True
-                            else:
-                                self.log_test("UI Generation Flow", False, f"Status check failed: {status_response.status}", time.time() - start_time)
-                                return False
+                            if status_data.get("status") in TERMINAL_JOB_STATUSES or time.monotonic() >= deadline:
+                                break
+                            await asyncio.sleep(STATUS_POLL_INTERVAL)
+                        
+                        status = status_data.get("status", "unknown")
+                        current_step = status_data.get("current_step", 0)
+                        total_steps = status_data.get("total_steps", 5)
+                        
+                        self.log_test("UI Generation Flow", True, 
+                            f"Job {job_id} status: {status}, Step: {current_step}/{total_steps}", 
+                            elapsed(start_time))
+                        return True
                     else:
-                        self.log_test("UI Generation Flow", False, "No job ID returned", time.time() - start_time)
+                        self.log_test("UI Generation Flow", False, "No job ID returned", elapsed(start_time))
                         return False
                 else:
-                    self.log_test("UI Generation Flow", False, f"Generation failed: {response.status}", time.time() - start_time)
+                    self.log_test("UI Generation Flow", False, f"Generation failed: {response.status}", elapsed(start_time))
                     return False
         except Exception as e:
-            self.log_test("UI Generation Flow", False, f"Error: {str(e)}", time.time() - start_time)
+            self.log_test("UI Generation Flow", False, f"Error: {str(e)}", elapsed(start_time))
             return False
     
     async def test_integration_points(self):
         """Test integration between different systems"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
             # Test that all systems work together
             integration_tests = [
@@ -338,7 +511,6 @@ export default ExportTestComponent;
             for integration in integration_tests:
                 # In a real test, we'd actually test the data flow
                 # For now, we'll simulate success
-                await asyncio.sleep(0.1)  # Simulate processing
                 passed_integrations += 1
             
             success_rate = passed_integrations / len(integration_tests)
@@ -346,15 +518,15 @@ export default ExportTestComponent;
             if success_rate >= 0.8:  # 80% success rate
                 self.log_test("Integration Points", True, 
                     f"{passed_integrations}/{len(integration_tests)} integrations working", 
-                    time.time() - start_time)
+                    elapsed(start_time))
                 return True
             else:
                 self.log_test("Integration Points", False, 
                     f"Only {passed_integrations}/{len(integration_tests)} integrations working", 
-                    time.time() - start_time)
+                    elapsed(start_time))
                 return False
         except Exception as e:
-            self.log_test("Integration Points", False, f"Error: {str(e)}", time.time() - start_time)
+            self.log_test("Integration Points", False, f"Error: {str(e)}", elapsed(start_time))
             return False
     
     async def run_all_tests(self):
@@ -362,30 +534,61 @@ export default ExportTestComponent;
         print("🚀 Starting AI UI Builder End-to-End Testing Suite")
         print("=" * 60)
         
-        total_start_time = time.time()
+        total_start_time = time.perf_counter_ns()
         
-        # Run all tests
-        tests = [
-            self.test_api_health(),
-            self.test_prompt_memory_system(),
-            self.test_component_detection(),
-            self.test_code_validation(),
-            self.test_test_generation(),
-            self.test_export_system(),
-            self.test_ui_generation_flow(),
-            self.test_integration_points()
-        ]
+        # Everything else talks to the API, so bail out early if it isn't up
+        healthy = await self.test_api_health()
+        if not healthy:
+            print("⚠️  API is not reachable, skipping remaining tests")
+            await self.generate_test_report(elapsed(total_start_time))
+            return [healthy]
         
-        results = await asyncio.gather(*tests, return_exceptions=True)
+        # Run the remaining tests, a few at a time so the dev server isn't flooded
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
         
-        total_duration = time.time() - total_start_time
+        async def guarded(test):
+            async with semaphore:
+                return await test()
         
-        # Generate report
-        self.generate_test_report(total_duration)
+        tests = [
+            self.test_prompt_memory_system,
+            self.test_component_detection,
+            self.test_code_validation,
+            self.test_test_generation,
+            self.test_export_system,
+            self.test_ui_generation_flow,
+            self.test_integration_points
+        ]
+        
+        # Tests report their own failures; anything that escapes one aborts the
+        # rest of the run, but the report is still written before it propagates
+        tasks = [asyncio.create_task(guarded(t)) for t in tests]
+        results = [healthy]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                await finished
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for test, task in zip(tests, tasks):
+                if task.cancelled():
+                    self.log_test(test.__name__, False, "Cancelled after the run was aborted")
+                    results.append(False)
+                elif task.exception() is not None:
+                    self.log_test(test.__name__, False, f"Error: {task.exception()}")
+                    results.append(False)
+                else:
+                    results.append(task.result())
+            
+            # Generate report
+            await self.generate_test_report(elapsed(total_start_time))
         
         return results
     
-    def generate_test_report(self, total_duration: float):
+    async def generate_test_report(self, total_duration: float):
         """Generate comprehensive test report"""
         print("\n" + "=" * 60)
         print("🧪 TEST REPORT SUMMARY")
@@ -422,15 +625,14 @@ export default ExportTestComponent;
         
         # Feature Status
         print(f"\n🎯 Feature Status:")
-        feature_status = {
-            "Prompt Memory": any("Prompt Memory" in r["test"] for r in self.test_results if r["success"]),
-            "Component Detection": any("Component Detection" in r["test"] for r in self.test_results if r["success"]),
-            "Code Validation": any("Code Validation" in r["test"] for r in self.test_results if r["success"]),
-            "Test Generation": any("Test Generation" in r["test"] for r in self.test_results if r["success"]),
-            "Export System": any("Export System" in r["test"] for r in self.test_results if r["success"]),
-            "UI Generation": any("UI Generation" in r["test"] for r in self.test_results if r["success"]),
-            "Integration": any("Integration" in r["test"] for r in self.test_results if r["success"])
-        }
+        feature_status = dict.fromkeys(REPORTED_FEATURES, False)
+        for result in self.test_results:
+            if not result["success"]:
+                continue
+            for feature in REPORTED_FEATURES:
+                if feature in result["test"]:
+                    feature_status[feature] = True
+                    break
         
         for feature, status in feature_status.items():
             status_icon = "✅" if status else "❌"
@@ -439,6 +641,12 @@ export default ExportTestComponent;
         print("\n" + "=" * 60)
         
         # Save detailed report
+        detailed_results = []
+        for result in self.test_results:
+            entry = dict(result)
+            entry["timestamp"] = datetime.fromtimestamp(entry.pop("ts_ns") / 1e9).isoformat()
+            detailed_results.append(entry)
+        
         report_data = {
             "timestamp": datetime.now().isoformat(),
             "summary": {
@@ -449,13 +657,12 @@ export default ExportTestComponent;
                 "total_duration": total_duration
             },
             "feature_status": feature_status,
-            "detailed_results": self.test_results
+            "detailed_results": detailed_results
         }
         
-        with open("ai-ui-builder/test_report.json", "w") as f:
-            json.dump(report_data, f, indent=2)
+        report_path = await asyncio.to_thread(write_report, REPORT_PATH, report_data)
         
-        print(f"📄 Detailed report saved to: ai-ui-builder/test_report.json")
+        print(f"📄 Detailed report saved to: {report_path}")
 
 async def main():
     """Main test runner"""
@@ -463,4 +670,11 @@ async def main():
         await tester.run_all_tests()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop isn't available on Windows; the default loop works everywhere.
+    # uvloop.run only exists from uvloop 0.18, and loop_factory from Python 3.12
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    elif uvloop is not None and sys.version_info >= (3, 12):
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -3,10 +3,19 @@
 Quick test to verify the frontend fixes are working
 """
 
+import hashlib
 import os
 import subprocess
 import sys
 
+# Records the package-lock.json hash node_modules was last installed from
+INSTALL_MARKER = ".install-hash"
+NPM_INSTALL_FLAGS = ["--prefer-offline", "--no-audit", "--no-fund"]
+
+# Build output goes to a log file (git-ignored via *.log) with a roomier Node heap
+BUILD_LOG = "build.log"
+BUILD_NODE_OPTIONS = "--max-old-space-size=4096"
+
 def test_frontend_syntax():
     """Test if the frontend components have valid syntax"""
     
@@ -15,33 +24,56 @@ def test_frontend_syntax():
         print("❌ Frontend directory not found")
         return False
     
-    # Check if node_modules exists
+    # Install dependencies unless node_modules already matches package-lock.json
     node_modules = os.path.join(frontend_dir, "node_modules")
-    if not os.path.exists(node_modules):
+    lockfile = os.path.join(frontend_dir, "package-lock.json")
+    marker = os.path.join(node_modules, INSTALL_MARKER)
+    
+    lock_hash = ""
+    if os.path.exists(lockfile):
+        with open(lockfile, "rb") as f:
+            lock_hash = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    
+    installed_hash = None
+    if os.path.exists(marker):
+        with open(marker) as f:
+            installed_hash = f.read().strip()
+    
+    if not os.path.exists(node_modules) or installed_hash != lock_hash:
         print("📦 Installing dependencies...")
+        # npm ci is a clean, lockfile-exact install; fall back to npm install without a lockfile
+        command = ["npm", "ci"] if lock_hash else ["npm", "install"]
         try:
-            subprocess.run(["npm", "install"], cwd=frontend_dir, check=True)
+            subprocess.run(command + NPM_INSTALL_FLAGS, cwd=frontend_dir, check=True)
         except subprocess.CalledProcessError:
             print("❌ Failed to install dependencies")
             return False
+        with open(marker, "w") as f:
+            f.write(lock_hash)
     
-    # Try to build the project
+    # Try to build the project, streaming the log to disk rather than into memory
     print("🔨 Testing build...")
+    build_log = os.path.join(frontend_dir, BUILD_LOG)
+    env = os.environ.copy()
+    env["NODE_OPTIONS"] = f"{env.get('NODE_OPTIONS', '')} {BUILD_NODE_OPTIONS}".strip()
     try:
-        result = subprocess.run(
-            ["npm", "run", "build"], 
-            cwd=frontend_dir, 
-            capture_output=True, 
-            text=True,
-            timeout=120
-        )
+        with open(build_log, "wb") as log:
+            result = subprocess.run(
+                ["npm", "run", "build"], 
+                cwd=frontend_dir, 
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                timeout=120
+            )
         
         if result.returncode == 0:
             print("✅ Frontend build successful!")
             return True
         else:
             print("❌ Build failed:")
-            print(result.stderr)
+            with open(build_log, encoding="utf-8", errors="replace") as log:
+                print(log.read())
             return False
             
     except subprocess.TimeoutExpired:
@@ -65,8 +97,18 @@ def check_component_files():
     print("📁 Checking component files...")
     all_exist = True
     
+    # One directory listing per parent instead of a stat per file
+    listings = {}
     for component in components:
-        if os.path.exists(component):
+        parent, name = os.path.split(component)
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = set()
+        
+        if name in listings[parent]:
             print(f"✅ {component}")
         else:
             print(f"❌ {component} - NOT FOUND")